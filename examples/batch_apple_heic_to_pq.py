@@ -0,0 +1,45 @@
+"""
+Example: Batch Apple HEIC to PQ AVIF conversion
+
+Converts a directory of Apple HEIC files to PQ AVIF in parallel.
+Each file is independent, so the work is spread across CPU cores with a
+ProcessPoolExecutor; processes (not threads) are used because HEIC decode,
+the NumPy gain-map math, and AVIF encode only partially release the GIL.
+"""
+
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import hdrconv.convert as convert
+import hdrconv.io as io
+
+
+def convert_one(heic_path: str) -> str:
+    """Convert a single Apple HEIC file to a PQ AVIF next to it."""
+    heic_data = io.read_apple_heic(heic_path)
+    hdr = convert.apple_heic_to_hdr(heic_data)
+
+    hdr_bt2020 = convert.convert_color_space(hdr, "bt2020")
+    pq_data = convert.apply_pq(hdr_bt2020)
+
+    output_path = str(Path(heic_path).with_suffix(".avif"))
+    io.write_22028_pq(pq_data, output_path)
+    return output_path
+
+
+if __name__ == "__main__":
+    input_dir = sys.argv[1] if len(sys.argv) > 1 else "images"
+    paths = sorted(str(p) for p in Path(input_dir).glob("*.HEIC"))
+
+    if not paths:
+        print(f"No HEIC files found in {input_dir}")
+        sys.exit(1)
+
+    print(f"Converting {len(paths)} files with {os.cpu_count()} workers...")
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+        for output_path in executor.map(convert_one, paths):
+            print(f"  ✓ {output_path}")
+
+    print("✓ Batch conversion complete!")
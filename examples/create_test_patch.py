@@ -23,10 +23,15 @@ baseline_image[:, :, 2] = 1.0
 alternate_image = np.zeros((image_height, image_width, 3), dtype=np.float32)
 alternate_image[:, :, 0] = 1.0
 
-# convert baseline to bt.2020
-baseline_image_bt2020 = colour.RGB_to_RGB(
-    baseline_image, input_colourspace="sRGB", output_colourspace="Display P3"
-)
+# convert baseline to Display P3 (sRGB shares BT.709 primaries)
+baseline_image_bt2020 = convert.convert_color_space(
+    {
+        "data": baseline_image,
+        "color_space": "bt709",
+        "transfer_function": "linear",
+    },
+    "p3",
+)["data"]
 
 hdr_image: HDRImage = {
     "data": alternate_image,
@@ -31,9 +31,14 @@ baseline_image = (
     gainmap_data["baseline"].astype(np.float32) / 255.0
 )  # Normalize to [0, 1]
 baseline = colour.eotf(baseline_image, function="sRGB")  # Convert to linear light
-baseline_bt2020 = colour.RGB_to_RGB(
-    baseline, input_colourspace="Display P3", output_colourspace="ITU-R BT.2020"
-)
+baseline_bt2020 = convert.convert_color_space(
+    {
+        "data": baseline.astype(np.float32),
+        "color_space": "p3",
+        "transfer_function": "linear",
+    },
+    "bt2020",
+)["data"]
 gainmap_data["baseline"] = (baseline_bt2020 * 255.0).astype(np.uint8)
 
 # Step 2: Convert Gainmap to linear HDR
@@ -46,18 +51,13 @@ print(f"  Value range: [{hdr['data'].min():.4f}, {hdr['data'].max():.4f}]")
 
 # Step 3: Apply PQ transfer function
 print("\nApplying PQ transfer function...")
-pq_encoded = colour.eotf_inverse(hdr["data"] * 203.0, function="ITU-R BT.2100 PQ")
+hdr["color_space"] = "bt2020"  # baseline was converted to BT.2020 above
+pq_data = convert.apply_pq(hdr)
 
-print(f"  PQ range: [{pq_encoded.min():.4f}, {pq_encoded.max():.4f}]")
+print(f"  PQ range: [{pq_data['data'].min():.4f}, {pq_data['data'].max():.4f}]")
 
 # Step 4: Write as ISO 22028-5 PQ AVIF
 print("\nWriting PQ AVIF...")
-pq_data = {
-    "data": pq_encoded,
-    "color_space": "bt2020",
-    "transfer_function": "pq",
-    "icc_profile": None,
-}
 io.write_22028_pq(pq_data, "output_from_21496.avif")
 
 print("✓ Conversion complete!")
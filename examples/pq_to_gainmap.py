@@ -7,8 +7,6 @@ Demonstrates converting from pure HDR format to Gainmap format.
 import hdrconv.io as io
 import hdrconv.convert as convert
 
-import colour
-
 # Step 1: Read PQ AVIF
 print("Reading PQ AVIF file...")
 pq_data = io.read_22028_pq("images/iso22028.avif")
@@ -19,15 +17,9 @@ print(f"  Transfer: {pq_data['transfer_function']}")
 
 # Step 2: Convert PQ to linear HDR
 print("\nConverting PQ to linear...")
-linear_hdr = colour.eotf(pq_data["data"], function="ITU-R BT.2100 PQ") / 203.0
-
-hdr = {
-    "data": linear_hdr,
-    "color_space": "bt2020",
-    "transfer_function": "linear",
-}
+hdr = convert.inverse_pq(pq_data)
 
-print(f"  Linear range: [{linear_hdr.min():.4f}, {linear_hdr.max():.4f}]")
+print(f"  Linear range: [{hdr['data'].min():.4f}, {hdr['data'].max():.4f}]")
 
 # Step 3: Convert HDR to Gainmap format
 
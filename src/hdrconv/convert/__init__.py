@@ -10,11 +10,16 @@ color space and transfer function transformations:
 """
 
 from hdrconv.convert.apple import apple_heic_to_hdr
+from hdrconv.convert.color import convert_color_space
 from hdrconv.convert.gainmap import gainmap_to_hdr, hdr_to_gainmap
+from hdrconv.convert.transfer import apply_pq, inverse_pq
 
 
 __all__ = [
     "gainmap_to_hdr",
     "hdr_to_gainmap",
     "apple_heic_to_hdr",
+    "convert_color_space",
+    "apply_pq",
+    "inverse_pq",
 ]
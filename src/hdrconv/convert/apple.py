@@ -22,6 +22,36 @@ from PIL import Image
 from hdrconv.core import AppleHeicData, HDRImage
 
 
+def _srgb_to_linear(values: np.ndarray) -> np.ndarray:
+    """Decode Apple's sRGB-like transfer curve to linear light."""
+    # Evaluate the pow branch once over the array, then patch the small
+    # dark-toe region; np.where would evaluate both branches everywhere
+    # and add a third full-array pass for the select.
+    linear = np.power((values + 0.052) * 0.948, 2.4)
+    low = values <= 0.04
+    linear[low] = values[low] * 0.077
+    return linear
+
+
+def _rec709_to_linear(values: np.ndarray) -> np.ndarray:
+    """Decode the Rec. 709 transfer curve (used by the gain map)."""
+    linear = np.power((values + 0.099) / 1.099, 1 / 0.45)
+    low = values <= 0.08145
+    linear[low] = values[low] / 4.5
+    return linear
+
+
+# Both inputs are uint8, so each transfer curve has only 256 distinct
+# values; a table gather per pixel replaces a per-pixel pow (and the
+# np.where forms above evaluate both branches over the full array).
+_SRGB_TO_LINEAR_LUT = _srgb_to_linear(
+    np.arange(256, dtype=np.float32) / 255.0
+).astype(np.float32)
+_REC709_TO_LINEAR_LUT = _rec709_to_linear(
+    np.arange(256, dtype=np.float32) / 255.0
+).astype(np.float32)
+
+
 def apple_heic_to_hdr(data: AppleHeicData) -> HDRImage:
     """Convert Apple HEIC gain map data to linear HDR.
 
@@ -47,7 +77,10 @@ def apple_heic_to_hdr(data: AppleHeicData) -> HDRImage:
         - ``icc_profile`` (bytes | None): None.
 
     Note:
-        The gain map is upscaled from 1/4 resolution using bilinear interpolation.
+        When the base dimensions are exact integer multiples of the gain map
+        dimensions (the usual case), the quarter-resolution gain map is
+        broadcast block-wise without materializing a full-resolution copy;
+        otherwise it is upscaled with bicubic interpolation.
         Both base image (sRGB transfer) and gain map (Rec. 709 transfer) are
         linearized before applying the formula.
 
@@ -61,38 +94,61 @@ def apple_heic_to_hdr(data: AppleHeicData) -> HDRImage:
         if base_image is None or gain_map is None:
             raise ValueError("Both base_image and gain_map must be provided.")
 
-        gain_map_resized = np.array(
-            Image.fromarray(gain_map).resize(
-                (base_image.shape[1], base_image.shape[0]), Image.BICUBIC
-            )
-        )
-
-        gain_map_norm = gain_map_resized.astype(np.float32) / 255.0
+        if gain_map.ndim == 3:
+            gain_map = gain_map[:, :, 0]
 
-        def rec709_to_linear(gain_map_channel):
-            return np.where(
-                gain_map_channel <= 0.08145,
-                gain_map_channel / 4.5,
-                np.power((gain_map_channel + 0.099) / 1.099, 1 / 0.45),
-            )
-
-        def srgb_to_linear(base_image_channel):
-            return np.where(
-                base_image_channel <= 0.04,
-                base_image_channel * 0.077,
-                np.power((base_image_channel + 0.052) * 0.948, 2.4),
-            )
-
-        gain_map_linear = rec709_to_linear(gain_map_norm)
-        # gain_map_linear = np.clip(gain_map_linear, 0.0, 1.0)
-
-        base_image_norm = base_image.astype(np.float32) / 255.0
-        base_image_linear = srgb_to_linear(base_image_norm)
+        if base_image.dtype == np.uint8:
+            base_image_linear = _SRGB_TO_LINEAR_LUT[base_image]
+        else:
+            # dtype=float32 fuses the cast and the divide into one pass.
+            base_image_norm = np.divide(base_image, np.float32(255.0), dtype=np.float32)
+            base_image_linear = _srgb_to_linear(base_image_norm)
         # base_image_linear = np.clip(base_image_linear, 0.0, 1.0)
 
-        hdr_image_linear = base_image_linear * (
-            1.0 + (headroom - 1.0) * gain_map_linear[..., np.newaxis]
+        h, w = base_image.shape[:2]
+        gh, gw = gain_map.shape[:2]
+
+        if gh > 0 and gw > 0 and h % gh == 0 and w % gw == 0:
+            # Exact integer upscale (Apple gain maps are half-res per axis):
+            # linearise the small map and broadcast it against tiled base
+            # blocks instead of materializing a full-resolution upscale.
+            # The per-pixel linearisation also runs on 1/4 the pixels.
+            scale_y, scale_x = h // gh, w // gw
+            # Build the multiplier in place on the quarter-res map; the
+            # only full-resolution pass left is the broadcast multiply.
+            if gain_map.dtype == np.uint8:
+                factor = _REC709_TO_LINEAR_LUT[gain_map]
+            else:
+                factor = _rec709_to_linear(
+                    np.divide(gain_map, np.float32(255.0), dtype=np.float32)
+                )
+            factor *= headroom - 1.0
+            factor += 1.0
+            hdr_image_linear = base_image_linear.reshape(gh, scale_y, gw, scale_x, 3)
+            hdr_image_linear = hdr_image_linear * factor[:, None, :, None, None]
+            return hdr_image_linear.reshape(h, w, 3)
+
+        # Non-integer ratio: linearise the small map first (the LUT runs
+        # on ~1/4 the pixels), then bicubic-resize the linear float map
+        # to full resolution. Interpolating decoded values differs
+        # slightly from decoding interpolated ones, but the gain map is
+        # smooth and the difference is well below quantization noise.
+        if gain_map.dtype == np.uint8:
+            gain_map_linear = _REC709_TO_LINEAR_LUT[gain_map]
+        else:
+            gain_map_linear = _rec709_to_linear(
+                np.divide(gain_map, np.float32(255.0), dtype=np.float32)
+            )
+        # np.asarray wraps Pillow's export buffer read-only instead of
+        # copying it again like np.array; the first arithmetic op below
+        # allocates the writable result.
+        factor = np.asarray(
+            Image.fromarray(gain_map_linear, mode="F").resize((w, h), Image.BICUBIC)
         )
+        factor = factor * np.float32(headroom - 1.0)
+        factor += 1.0
+        hdr_image_linear = base_image_linear
+        hdr_image_linear *= factor[..., np.newaxis]
         # hdr_image_linear = np.clip(hdr_image_linear, 0.0, None)
         return hdr_image_linear
 
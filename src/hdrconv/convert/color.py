@@ -0,0 +1,123 @@
+"""Color space conversion utilities.
+
+This module provides functions for converting linear RGB image data between
+the color spaces used across the library.
+
+Public APIs:
+    - `convert_color_space`: Convert HDRImage between RGB color spaces
+
+The conversion is applied as one batched matrix multiply over the whole
+(..., 3) array rather than per-pixel, so a full image is a single GEMM.
+"""
+
+from __future__ import annotations
+
+import functools
+import warnings
+
+import numpy as np
+
+with warnings.catch_warnings():
+    warnings.filterwarnings("ignore")
+    import colour
+
+from hdrconv.core import HDRImage
+
+# Library color space identifiers -> colour-science colourspace names
+_COLOURSPACE_NAMES = {
+    "bt709": "ITU-R BT.709",
+    "p3": "Display P3",
+    "bt2020": "ITU-R BT.2020",
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _matrix_pair(space_a: str, space_b: str) -> tuple[np.ndarray, np.ndarray]:
+    """Build forward and inverse matrices for a canonical space pair.
+
+    The forward matrix is derived once through colour-science; the reverse
+    direction is its `np.linalg.inv`, computed in float64 and cached, so a
+    round trip costs one colour derivation and one 3x3 inversion total.
+    Both matrices are stored as C-contiguous float32.
+    """
+    matrix = colour.matrix_RGB_to_RGB(
+        colour.RGB_COLOURSPACES[_COLOURSPACE_NAMES[space_a]],
+        colour.RGB_COLOURSPACES[_COLOURSPACE_NAMES[space_b]],
+    )
+    forward = np.ascontiguousarray(matrix, dtype=np.float32)
+    inverse = np.ascontiguousarray(np.linalg.inv(matrix), dtype=np.float32)
+    return forward, inverse
+
+
+def _conversion_matrix(input_space: str, output_space: str) -> np.ndarray:
+    """Look up the 3x3 RGB-to-RGB matrix between two library color spaces.
+
+    Pairs are cached in canonical order with their inverse, so converting
+    in either direction never recomputes the colour-science derivation
+    (which dwarfs the actual 3x3 product).
+
+    Args:
+        input_space: Source color space ('bt709', 'p3', 'bt2020').
+        output_space: Target color space ('bt709', 'p3', 'bt2020').
+
+    Returns:
+        3x3 conversion matrix, float32, C-contiguous.
+
+    Raises:
+        ValueError: If either color space identifier is unknown.
+    """
+    for space in (input_space, output_space):
+        if space not in _COLOURSPACE_NAMES:
+            raise ValueError(
+                f"Unknown color space '{space}'. "
+                f"Supported: {sorted(_COLOURSPACE_NAMES)}"
+            )
+
+    space_a, space_b = sorted((input_space, output_space))
+    forward, inverse = _matrix_pair(space_a, space_b)
+    return forward if input_space == space_a else inverse
+
+
+def convert_color_space(hdr: HDRImage, output_space: str) -> HDRImage:
+    """Convert a linear HDR image to another RGB color space.
+
+    Applies the RGB-to-RGB primaries conversion as a single batched
+    ``data @ M.T`` multiply over the whole (H, W, 3) array, so the cost is
+    one GEMM instead of millions of per-pixel matrix products.
+
+    Args:
+        hdr: HDRImage dict with linear data and a ``color_space`` key.
+        output_space: Target color space ('bt709', 'p3', 'bt2020').
+
+    Returns:
+        HDRImage dict with converted data and updated ``color_space``.
+        The transfer function is carried over unchanged.
+
+    Raises:
+        ValueError: If the input has no color_space, uses an unknown color
+            space identifier, or is not in linear transfer.
+
+    See Also:
+        - `apple_heic_to_hdr`: Produces 'p3' linear HDRImage input.
+    """
+    if "color_space" not in hdr:
+        raise ValueError("HDRImage has no color_space; cannot convert.")
+    if hdr["transfer_function"] != "linear":
+        raise ValueError(
+            "convert_color_space operates on linear data; got "
+            f"'{hdr['transfer_function']}'. Decode to linear first."
+        )
+
+    input_space = hdr["color_space"]
+    if input_space == output_space:
+        return hdr
+
+    matrix = _conversion_matrix(input_space, output_space)
+    converted = hdr["data"] @ matrix.T
+
+    return HDRImage(
+        data=converted,
+        color_space=output_space,
+        transfer_function="linear",
+        icc_profile=None,
+    )
@@ -14,18 +14,26 @@ See Also:
 from __future__ import annotations
 
 from typing import Optional
-import warnings
 
 from PIL import Image
 import numpy as np
 
-with warnings.catch_warnings():
-    warnings.filterwarnings("ignore")
-    import colour
-
 from hdrconv.core import GainmapImage, GainmapMetadata, HDRImage
 
 
+def _srgb_encode(values: np.ndarray) -> np.ndarray:
+    """Apply the sRGB OETF (IEC 61966-2-1) in the input's precision."""
+    # Evaluate the pow branch once over the array, in place, then patch
+    # the small linear-toe region; np.where would evaluate both branches
+    # everywhere and add a third full-array pass for the select.
+    encoded = np.power(values, 1 / 2.4)
+    encoded *= 1.055
+    encoded -= 0.055
+    low = values <= 0.0031308
+    encoded[low] = values[low] * 12.92
+    return encoded
+
+
 def gainmap_to_hdr(
     data: GainmapImage,
 ) -> HDRImage:
@@ -53,34 +61,12 @@ def gainmap_to_hdr(
     See Also:
         - `hdr_to_gainmap`: Inverse operation, create gainmap from HDR.
     """
-    baseline = data["baseline"].astype(np.float32) / 255.0  # Normalize to [0, 1]
-    gainmap = data["gainmap"].astype(np.float32) / 255.0
+    # Normalize to [0, 1]: dtype=float32 fuses the cast and the divide
+    # into one pass instead of materializing a float copy first.
+    baseline = np.divide(data["baseline"], np.float32(255.0), dtype=np.float32)
+    gainmap = data["gainmap"]
     metadata = data["metadata"]
 
-    # Resize gainmap to match baseline if needed
-    h, w = baseline.shape[:2]
-    if gainmap.shape[:2] != (h, w):
-        # Use Pillow for resizing: convert float32 [0,1] -> uint8 [0,255] -> resize -> back to float32
-        gainmap_uint8 = np.clip(gainmap * 255.0, 0, 255).astype(np.uint8)
-
-        # Handle 2D grayscale and 3D RGB arrays
-        if gainmap_uint8.ndim == 2:
-            pil_image = Image.fromarray(gainmap_uint8, mode="L")
-        else:
-            pil_image = Image.fromarray(gainmap_uint8, mode="RGB")
-
-        # Resize using bilinear interpolation (equivalent to cv2.INTER_LINEAR)
-        pil_image_resized = pil_image.resize((w, h), Image.BILINEAR)
-
-        # Convert back to float32 [0,1]
-        gainmap = np.array(pil_image_resized, dtype=np.float32) / 255.0
-
-    # Ensure gainmap is 3-channel for calculations
-    if gainmap.ndim == 2:
-        gainmap = gainmap[:, :, np.newaxis]
-    if gainmap.shape[2] == 1:
-        gainmap = np.repeat(gainmap, 3, axis=2)
-
     # Extract metadata (convert to arrays for broadcasting)
     gainmap_min = np.array(metadata["gainmap_min"], dtype=np.float32)
     gainmap_max = np.array(metadata["gainmap_max"], dtype=np.float32)
@@ -88,20 +74,100 @@ def gainmap_to_hdr(
     baseline_offset = np.array(metadata["baseline_offset"], dtype=np.float32)
     alternate_offset = np.array(metadata["alternate_offset"], dtype=np.float32)
 
-    gainmap = np.clip(gainmap, 0.0, 1.0)
-
-    # Decode gainmap: apply gamma, scale, and offset
-    gainmap_decoded = (gainmap ** (1 / gainmap_gamma)) * (
-        gainmap_max - gainmap_min
-    ) + gainmap_min
-
-    # Convert to linear multiplier
-    gainmap_linear = np.exp2(gainmap_decoded)
-
-    # Reconstruct alternate (HDR) image
-    hdr_linear = gainmap_linear * (baseline + baseline_offset) - alternate_offset
+    h, w = baseline.shape[:2]
 
-    hdr_linear = np.clip(hdr_linear, 0.0, None)
+    if gainmap.dtype == np.uint8:
+        # Resize in uint8 (no float round-trip through Pillow)
+        if gainmap.shape[:2] != (h, w):
+            if gainmap.ndim == 3 and gainmap.shape[2] == 1:
+                gainmap = gainmap[:, :, 0]
+            if gainmap.ndim == 2:
+                pil_image = Image.fromarray(gainmap, mode="L")
+            else:
+                pil_image = Image.fromarray(gainmap, mode="RGB")
+            # Bilinear interpolation (equivalent to cv2.INTER_LINEAR)
+            gainmap = np.asarray(pil_image.resize((w, h), Image.BILINEAR))
+
+        # The decode depends only on the uint8 code and per-image scalar
+        # metadata: build a (256, 3) table once and gather per pixel,
+        # instead of a per-pixel pow and exp2 over the whole image.
+        codes = np.arange(256, dtype=np.float32)[:, np.newaxis] / 255.0
+        lut = np.exp2(
+            codes ** (1 / gainmap_gamma) * (gainmap_max - gainmap_min) + gainmap_min
+        ).astype(np.float32)
+
+        if gainmap.ndim == 3 and gainmap.shape[2] == 3:
+            gainmap = lut[gainmap, np.arange(3)]
+        else:
+            # Single-channel map: never stack three copies. With uniform
+            # metadata the decoded map stays (H, W, 1) and broadcasting
+            # expands it in the multiply; per-channel metadata gathers
+            # the full LUT row, which is the 3-channel result directly.
+            if gainmap.ndim == 3:
+                gainmap = gainmap[:, :, 0]
+            if (lut == lut[:, :1]).all():
+                gainmap = lut[:, 0][gainmap][:, :, np.newaxis]
+            else:
+                gainmap = lut[gainmap]
+    else:
+        gainmap = np.divide(gainmap, np.float32(255.0), dtype=np.float32)
+
+        # Resize gainmap to match baseline if needed. The float map is
+        # resized directly (per channel, Pillow mode "F"), which avoids
+        # both the old quantize-to-uint8 round-trip and a full-res dtype
+        # conversion after the upsample.
+        if gainmap.shape[:2] != (h, w):
+            if gainmap.ndim == 3 and gainmap.shape[2] == 1:
+                gainmap = gainmap[:, :, 0]
+            # np.asarray wraps Pillow's float32 export buffer read-only
+            # instead of copying it again like np.array; the clip below
+            # (and np.stack here) allocates the writable array.
+            if gainmap.ndim == 2:
+                gainmap = np.asarray(
+                    Image.fromarray(gainmap, mode="F").resize((w, h), Image.BILINEAR)
+                )
+            else:
+                gainmap = np.stack(
+                    [
+                        np.asarray(
+                            Image.fromarray(gainmap[:, :, c], mode="F").resize(
+                                (w, h), Image.BILINEAR
+                            )
+                        )
+                        for c in range(gainmap.shape[2])
+                    ],
+                    axis=2,
+                )
+
+        # Ensure gainmap is 3-channel for calculations
+        if gainmap.ndim == 2:
+            gainmap = gainmap[:, :, np.newaxis]
+        if gainmap.shape[2] == 1:
+            gainmap = np.repeat(gainmap, 3, axis=2)
+
+        # gainmap owns its buffer on every path above (divide, repeat or
+        # stack output), so the clip can run in place.
+        np.clip(gainmap, 0.0, 1.0, out=gainmap)
+
+        # Decode gainmap in place: gamma, scale, offset, and 2**x all
+        # reuse the clip copy, and the baseline buffer (itself a fresh
+        # float32 copy) carries the reconstruction, so the whole chain
+        # costs two image-sized buffers instead of one per step.
+        if np.any(gainmap_gamma != 1.0):  # gamma 1 makes pow the identity
+            np.power(gainmap, 1 / gainmap_gamma, out=gainmap)
+        gainmap *= gainmap_max - gainmap_min
+        gainmap += gainmap_min
+        np.exp2(gainmap, out=gainmap)
+
+    # Reconstruct alternate (HDR) image. The offsets are commonly zero,
+    # in which case their full-image add/subtract passes are skipped.
+    hdr_linear = baseline
+    if np.any(baseline_offset != 0.0):
+        hdr_linear += baseline_offset
+    hdr_linear *= gainmap
+    if np.any(alternate_offset != 0.0):
+        hdr_linear -= alternate_offset
+    np.clip(hdr_linear, 0.0, None, out=hdr_linear)
 
     return HDRImage(
         data=hdr_linear,
@@ -149,10 +215,9 @@ def hdr_to_gainmap(
     """
     hdr_data = hdr["data"].astype(np.float32)
 
-    # Generate baseline if not provided
+    # Generate baseline if not provided; clip allocates the copy itself.
     if baseline is None:
-        baseline = hdr_data.copy()
-        baseline = np.clip(baseline, 0.0, 1.0)
+        baseline = np.clip(hdr_data, 0.0, 1.0)
 
     # Compute alt headroom
     alt_headroom = np.log2(hdr_data.max() + 1e-6)
@@ -165,7 +230,7 @@ def hdr_to_gainmap(
     base_offset = float(1 / 64)
 
     ratio = (hdr_data + alt_offset) / (baseline + base_offset)
-    ratio = np.clip(ratio, 1e-6, None)
+    np.clip(ratio, 1e-6, None, out=ratio)
 
     gainmap_log = np.log2(ratio)
 
@@ -179,13 +244,18 @@ def hdr_to_gainmap(
             gainmap_norm[:, :, i] = 0.0
         else:
             gainmap_norm[:, :, i] = (gainmap_log[:, :, i] - gainmap_min_val[i]) / diff
-    gainmap_norm = np.clip(gainmap_norm, 0, 1)
+    np.clip(gainmap_norm, 0, 1, out=gainmap_norm)
 
-    gainmap_norm = gainmap_norm**gamma
+    # gamma defaults to 1.0, where pow is the identity; otherwise run it
+    # in place on the clip copy instead of allocating another buffer.
+    if gamma != 1.0:
+        np.power(gainmap_norm, gamma, out=gainmap_norm)
 
     gainmap_uint8 = (gainmap_norm * 255).astype(np.uint8)
 
-    baseline = colour.eotf_inverse(baseline, function="sRGB")
+    # Inline float32 sRGB encode: colour.eotf_inverse promotes the whole
+    # image to float64, doubling the traffic of this memory-bound step.
+    baseline = _srgb_encode(baseline)
     baseline_uint8 = (baseline * 255).astype(np.uint8)
 
     gainmap_min_val = tuple(gainmap_min_val.tolist())
@@ -0,0 +1,128 @@
+"""Transfer function utilities.
+
+This module provides SMPTE ST 2084 (PQ) encoding and decoding for HDR
+image data.
+
+Public APIs:
+    - `apply_pq`: Encode linear HDRImage to PQ
+    - `inverse_pq`: Decode PQ HDRImage to linear
+
+The kernels are written as fused float32 NumPy expressions that reuse
+their intermediates in place, so each direction costs two image-sized
+temporaries instead of one per arithmetic step.
+
+See Also:
+    SMPTE ST 2084 / ITU-R BT.2100: Perceptual Quantizer
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+from hdrconv.core import HDRImage
+
+# SMPTE ST 2084 constants
+_M1 = np.float32(2610 / 16384)
+_M2 = np.float32(2523 / 4096 * 128)
+_C1 = np.float32(3424 / 4096)
+_C2 = np.float32(2413 / 4096 * 32)
+_C3 = np.float32(2392 / 4096 * 32)
+
+
+def apply_pq(hdr: HDRImage, reference_white: float = 203.0) -> HDRImage:
+    """Encode a linear HDR image with the PQ transfer function.
+
+    Maps linear light (1.0 = reference white) to PQ-encoded values in
+    [0, 1] representing 0-10000 nits, per SMPTE ST 2084.
+
+    Args:
+        hdr: HDRImage dict with linear data, float, shape (H, W, 3).
+        reference_white: Luminance of 1.0 in the input, in nits.
+            Default: 203.0 (ITU-R BT.2408 reference white).
+
+    Returns:
+        HDRImage dict with PQ-encoded float32 data in [0, 1] and
+        ``transfer_function`` set to 'pq'. Color space is carried over.
+
+    Raises:
+        ValueError: If the input is not in linear transfer.
+
+    See Also:
+        - `inverse_pq`: Inverse operation, decode PQ to linear.
+    """
+    if hdr["transfer_function"] != "linear":
+        raise ValueError(
+            f"apply_pq expects linear input; got '{hdr['transfer_function']}'."
+        )
+
+    # Normalize to display luminance fraction of 10000 nits.
+    y = hdr["data"].astype(np.float32) * np.float32(reference_white / 10000.0)
+    np.clip(y, 0.0, 1.0, out=y)
+
+    # N = ((c1 + c2*Y^m1) / (1 + c3*Y^m1)) ^ m2, with Y^m1 computed once
+    # and both ratio operands built in place.
+    np.power(y, _M1, out=y)
+    numerator = y * _C2
+    numerator += _C1
+    y *= _C3
+    y += np.float32(1.0)
+    numerator /= y
+    np.power(numerator, _M2, out=numerator)
+
+    result = HDRImage(
+        data=numerator,
+        transfer_function="pq",
+        icc_profile=None,
+    )
+    if "color_space" in hdr:
+        result["color_space"] = hdr["color_space"]
+    return result
+
+
+def inverse_pq(hdr: HDRImage, reference_white: float = 203.0) -> HDRImage:
+    """Decode a PQ-encoded HDR image to linear light.
+
+    Maps PQ values in [0, 1] (0-10000 nits) to linear light scaled so that
+    1.0 equals the given reference white, per SMPTE ST 2084.
+
+    Args:
+        hdr: HDRImage dict with PQ data, float, shape (H, W, 3), range [0, 1].
+        reference_white: Luminance mapped to 1.0 in the output, in nits.
+            Default: 203.0 (ITU-R BT.2408 reference white).
+
+    Returns:
+        HDRImage dict with linear float32 data and ``transfer_function``
+        set to 'linear'. Color space is carried over.
+
+    Raises:
+        ValueError: If the input is not PQ-encoded.
+
+    See Also:
+        - `apply_pq`: Inverse operation, encode linear to PQ.
+    """
+    if hdr["transfer_function"] != "pq":
+        raise ValueError(
+            f"inverse_pq expects PQ input; got '{hdr['transfer_function']}'."
+        )
+
+    e = hdr["data"].astype(np.float32)
+    np.clip(e, 0.0, 1.0, out=e)
+
+    # Y = (max(E^(1/m2) - c1, 0) / (c2 - c3*E^(1/m2))) ^ (1/m1)
+    np.power(e, np.float32(1.0) / _M2, out=e)
+    numerator = e - _C1
+    np.maximum(numerator, 0.0, out=numerator)
+    e *= -_C3
+    e += _C2
+    numerator /= e
+    np.power(numerator, np.float32(1.0) / _M1, out=numerator)
+    numerator *= np.float32(10000.0 / reference_white)
+
+    result = HDRImage(
+        data=numerator,
+        transfer_function="linear",
+        icc_profile=None,
+    )
+    if "color_space" in hdr:
+        result["color_space"] = hdr["color_space"]
+    return result
@@ -37,7 +37,10 @@ def has_gain_map(input_path: str) -> bool:
         - `read_apple_heic`: Extract gain map data from HEIC file.
     """
     has_gain_map = False
-    heif_file = pillow_heif.read_heif(input_path, convert_hdr_to_8bit=False)
+    # open_heif parses the container structure lazily without decoding the
+    # primary image; the aux listing lives in the metadata, so a full decode
+    # would be wasted work for a pure identification pass.
+    heif_file = pillow_heif.open_heif(input_path, convert_hdr_to_8bit=False)
 
     if "aux" in heif_file.info:
         aux_info = heif_file.info["aux"]
@@ -14,10 +14,15 @@ Note:
     Requires exiftool to be installed for headroom metadata extraction.
 """
 
+import atexit
+import functools
+import mmap
+import os
+import re
 import shutil
+import struct
 import pillow_heif
 import numpy as np
-from PIL import Image
 from typing import Tuple, Optional
 from pathlib import Path
 from exiftool import ExifToolHelper
@@ -38,6 +43,107 @@ from hdrconv.core import AppleHeicData
 HDR_GAIN_MAP_URN = "urn:com:apple:photo:2020:aux:hdrgainmap"
 
 
+# Maps pillow_heif image modes to (dtype, channel count). Explicit dtypes
+# (including endianness for 16-bit modes) let np.frombuffer interpret the
+# decoder buffer directly, with no byte-order swap pass.
+_MODE_TO_DTYPE = {
+    "L": (np.dtype(np.uint8), 1),
+    "LA": (np.dtype(np.uint8), 2),
+    "RGB": (np.dtype(np.uint8), 3),
+    "RGBA": (np.dtype(np.uint8), 4),
+    "BGR": (np.dtype(np.uint8), 3),
+    "BGRA": (np.dtype(np.uint8), 4),
+    "I;16": (np.dtype("<u2"), 1),
+    "I;16L": (np.dtype("<u2"), 1),
+    "I;16B": (np.dtype(">u2"), 1),
+    "L;16": (np.dtype("<u2"), 1),
+    "LA;16": (np.dtype("<u2"), 2),
+    "RGB;16": (np.dtype("<u2"), 3),
+    "RGBA;16": (np.dtype("<u2"), 4),
+    "BGR;16": (np.dtype("<u2"), 3),
+    "BGRA;16": (np.dtype("<u2"), 4),
+}
+
+
+def _heif_to_ndarray(heif_image, out: Optional[np.ndarray] = None) -> np.ndarray:
+    """Build a NumPy array directly from a decoded HEIF image buffer.
+
+    Goes straight from the raw ``heif_image.data`` buffer to an ndarray with
+    a single `np.frombuffer` + reshape, skipping the intermediate
+    ``PIL.Image.frombytes`` round-trip (which copies the buffer once inside
+    PIL and again when converting to NumPy).
+
+    Args:
+        heif_image: A `pillow_heif` image object (main or auxiliary) exposing
+            ``mode``, ``size``, ``stride``, and ``data``.
+        out: Optional preallocated destination of matching shape and dtype.
+            When given, the pixels are copied into it and it is returned,
+            letting batch loops reuse one buffer instead of allocating (and
+            first-touch faulting) a fresh image-sized array per file.
+
+    Returns:
+        Array of shape (H, W) for single-channel modes or (H, W, C) otherwise,
+        dtype uint8 or uint16 depending on bit depth. Without ``out`` this is
+        a read-only view over ``heif_image.data`` (kept alive through the
+        array's base reference), so no pixel copy is made.
+    """
+    width, height = heif_image.size
+    mode = heif_image.mode
+
+    if mode in _MODE_TO_DTYPE:
+        dtype, channels = _MODE_TO_DTYPE[mode]
+    elif ";16" in mode:
+        dtype = np.dtype(np.uint16)
+        channels = max(len(mode.split(";")[0]), 1)
+    else:
+        dtype = np.dtype(np.uint8)
+        channels = len(mode)
+
+    arr = np.frombuffer(heif_image.data, dtype=dtype)
+    row_items = heif_image.stride // dtype.itemsize
+
+    if row_items == width * channels:
+        arr = arr.reshape(height, width * channels)
+    else:
+        # Stride includes row padding: drop it after reshaping to full rows.
+        arr = arr.reshape(height, row_items)[:, : width * channels]
+
+    if channels == 1:
+        arr = arr.reshape(height, width)
+    else:
+        arr = arr.reshape(height, width, channels)
+
+    if out is not None:
+        np.copyto(out, arr)
+        return out
+    return arr
+
+
+def _read_heif(input_path: str):
+    """Read a HEIF container with the file bytes prefetched via mmap.
+
+    Maps the file read-only and advises the kernel that the whole mapping
+    will be needed sequentially, so page-ins overlap with container parsing
+    and decode instead of stalling on demand faults. Falls back to the
+    plain path-based read when mapping fails (empty file, exotic
+    filesystem, platform without madvise).
+    """
+    try:
+        with open(input_path, "rb") as f:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        return pillow_heif.read_heif(input_path, convert_hdr_to_8bit=False)
+
+    try:
+        if hasattr(mmap, "MADV_SEQUENTIAL"):
+            mapped.madvise(mmap.MADV_SEQUENTIAL)
+        if hasattr(mmap, "MADV_WILLNEED"):
+            mapped.madvise(mmap.MADV_WILLNEED)
+        return pillow_heif.read_heif(mapped, convert_hdr_to_8bit=False)
+    finally:
+        mapped.close()
+
+
 def read_base_and_gain_map(input_path: str) -> Tuple[np.ndarray, Optional[np.ndarray]]:
     """Read base image and HDR gain map from Apple HEIC file.
 
@@ -59,23 +165,76 @@ def read_base_and_gain_map(input_path: str) -> Tuple[np.ndarray, Optional[np.nda
     Note:
         The gain map is typically at 1/4 resolution of the base image
         and uses a single grayscale channel.
+
+        Both arrays are read-only views over the decoder's buffer (which
+        they keep alive), not copies: downstream float conversions read
+        them directly without an intermediate uint8 copy. Call ``.copy()``
+        at the call site if a writable array is needed.
     """
     try:
-        heif_file = pillow_heif.read_heif(input_path, convert_hdr_to_8bit=False)
+        heif_file = _read_heif(input_path)
     except Exception as e:
         print(f"Error: Unable to read HEIC file '{input_path}': {e}")
         raise
 
+    return _base_and_gain_map_from_heif(heif_file)
+
+
+def read_base_only(
+    input_path: str, out: Optional[np.ndarray] = None
+) -> np.ndarray:
+    """Read only the base image from an Apple HEIC file.
+
+    Opens the container lazily and decodes just the primary image, skipping
+    the gain map auxiliary image entirely.
+
+    Args:
+        input_path: Path to the input HEIC image file.
+        out: Optional preallocated destination of matching shape and dtype;
+            batch workers can reuse one buffer across same-sized files
+            instead of paying an allocation per frame.
+
+    Returns:
+        Base image array, uint8/uint16, shape (H, W, 3). The ``out`` array
+        when provided, a fresh array otherwise.
+    """
+    heif_file = pillow_heif.open_heif(input_path, convert_hdr_to_8bit=False)
+    return _heif_to_ndarray(heif_file, out=out)
+
+
+def read_gain_map_only(input_path: str) -> Optional[np.ndarray]:
+    """Read only the HDR gain map from an Apple HEIC file.
+
+    Opens the container lazily and decodes just the gain map auxiliary
+    image, so the (much larger) primary image is never decoded.
+
+    Args:
+        input_path: Path to the input HEIC image file.
+
+    Returns:
+        Gain map array, shape (H, W), or None if no HDR gain map
+        auxiliary image exists.
+    """
+    heif_file = pillow_heif.open_heif(input_path, convert_hdr_to_8bit=False)
+
+    gain_map_ids = heif_file.info.get("aux", {}).get(HDR_GAIN_MAP_URN)
+    if not gain_map_ids:
+        return None
+
+    try:
+        aux_image = heif_file.get_aux_image(gain_map_ids[0])
+        return _heif_to_ndarray(aux_image)
+    except Exception as e:
+        print(f"Warning: Unable to extract gain map with ID {gain_map_ids[0]}: {e}")
+        return None
+
+
+def _base_and_gain_map_from_heif(
+    heif_file,
+) -> Tuple[np.ndarray, Optional[np.ndarray]]:
+    """Extract base image and gain map arrays from an open HEIF file."""
     # Base Image
-    base_image_pil = Image.frombytes(
-        heif_file.mode,
-        heif_file.size,
-        heif_file.data,
-        "raw",
-        heif_file.mode,
-        heif_file.stride,
-    )
-    base_image_np = np.array(base_image_pil)
+    base_image_np = _heif_to_ndarray(heif_file)
 
     # Gain Map
     gain_map_np = None  # Default to None if not found
@@ -91,16 +250,8 @@ def read_base_and_gain_map(input_path: str) -> Tuple[np.ndarray, Optional[np.nda
                 # Use the ID to get the auxiliary image object
                 aux_image = heif_file.get_aux_image(gain_map_id)
 
-                # Create a PIL.Image object from the raw data, mode, size, and stride
-                gain_map_pil = Image.frombytes(
-                    aux_image.mode,
-                    aux_image.size,
-                    aux_image.data,
-                    "raw",
-                    aux_image.mode,
-                    aux_image.stride,
-                )
-                gain_map_np = np.array(gain_map_pil)
+                # Build the array directly from the raw buffer (no PIL round-trip)
+                gain_map_np = _heif_to_ndarray(aux_image)
             except Exception as e:
                 # Handle rare cases where the ID exists but the image data cannot be extracted
                 print(f"Warning: Unable to extract gain map with ID {gain_map_id}: {e}")
@@ -119,6 +270,25 @@ def read_base_and_gain_map(input_path: str) -> Tuple[np.ndarray, Optional[np.nda
     """
 
 
+# Long-lived ExifTool process shared across calls. Spawning ExifTool is a
+# ~100-300 ms Perl startup, which dominates wall time when batch-converting
+# a folder of HEICs; one persistent process amortizes it away.
+_exiftool_helper: Optional[ExifToolHelper] = None
+
+
+def _get_exiftool() -> ExifToolHelper:
+    """Return the shared ExifTool process, starting it on first use.
+
+    The process is terminated automatically at interpreter exit.
+    """
+    global _exiftool_helper
+    if _exiftool_helper is None or not _exiftool_helper.running:
+        _exiftool_helper = ExifToolHelper()
+        _exiftool_helper.run()
+        atexit.register(_exiftool_helper.terminate)
+    return _exiftool_helper
+
+
 def _check_exiftool_installed() -> None:
     """Check if exiftool is installed and accessible.
 
@@ -135,55 +305,295 @@ def _check_exiftool_installed() -> None:
         )
 
 
-def get_headroom(file_path: str | Path, use_makernote: bool = False) -> float:
-    """Extract HDR headroom from Apple HEIC metadata.
+# Exact tags requested from ExifTool; exact names avoid wildcard group
+# expansion on the ExifTool side, and building the tuple once avoids
+# re-allocating the list on every call.
+_HEADROOM_TAGS = (
+    "XMP:HDRGainMapHeadroom",
+    "MakerNotes:HDRHeadroom",
+    "MakerNotes:HDRGain",
+)
+
+
+# Matches HDRGainMapHeadroom both as an XMP attribute (="3.75") and as an
+# element value (>3.75<) inside the raw XMP packet.
+_XMP_HEADROOM_RE = re.compile(
+    rb"HDRGainMapHeadroom\s*(?:=\s*[\"']|>)\s*([0-9]+(?:\.[0-9]+)?)"
+)
+
+
+def _headroom_from_xmp(xmp_bytes: Optional[bytes]) -> Optional[float]:
+    """Extract HDR headroom from a raw XMP packet, if present.
+
+    The HEIF container already carries the XMP block that ExifTool would
+    otherwise re-read from disk, so parsing it in-process avoids a second
+    file open and the ExifTool subprocess entirely.
 
     Args:
-        file_path: Path to the HEIC file.
+        xmp_bytes: Raw XMP packet bytes from ``heif_file.info["xmp"]``,
+            or None if the container has no XMP.
+
+    Returns:
+        Headroom value if the XMP tag is present, None otherwise.
+    """
+    if not xmp_bytes:
+        return None
+    match = _XMP_HEADROOM_RE.search(xmp_bytes)
+    if match is None:
+        return None
+    return float(match.group(1))
+
+
+# Apple MakerNote tags carrying the HDR headroom inputs (decimal 33 / 48,
+# ExifTool names HDRHeadroom / HDRGain).
+_APPLE_TAG_HDR_HEADROOM = 0x0021
+_APPLE_TAG_HDR_GAIN = 0x0030
+
+
+def _find_ifd_entry(
+    tiff: bytes, endian: str, ifd_offset: int, wanted_tag: int
+) -> Optional[Tuple[int, int, int]]:
+    """Find one entry in a TIFF IFD.
+
+    Returns:
+        Tuple of (type, count, value_or_offset) for the entry, or None if
+        the tag is absent or the IFD is truncated.
+    """
+    if ifd_offset + 2 > len(tiff):
+        return None
+    (num_entries,) = struct.unpack_from(f"{endian}H", tiff, ifd_offset)
+    cursor = ifd_offset + 2
+    for _ in range(num_entries):
+        if cursor + 12 > len(tiff):
+            return None
+        tag, typ, cnt, val = struct.unpack_from(f"{endian}HHII", tiff, cursor)
+        if tag == wanted_tag:
+            return typ, cnt, val
+        cursor += 12
+    return None
+
+
+def _parse_apple_makernote(exif_bytes: Optional[bytes]) -> Optional[Tuple[float, float]]:
+    """Extract (HDRHeadroom, HDRGain) from an Apple EXIF MakerNote.
+
+    Walks the TIFF structure in-process: IFD0 -> Exif IFD -> MakerNote
+    (tag 0x927C) -> Apple's "Apple iOS" maker IFD, then reads the two
+    rational headroom tags. This replaces a ~100 ms ExifTool subprocess
+    with a few microseconds of byte twiddling for the common case.
+
+    Args:
+        exif_bytes: Raw EXIF blob from ``heif_file.info["exif"]``.
+
+    Returns:
+        (maker33, maker48) floats, or None if the blob is missing, not an
+        Apple MakerNote, or structurally unexpected.
+    """
+    if not exif_bytes:
+        return None
+
+    try:
+        # Locate the TIFF header; HEIF EXIF blobs usually carry an
+        # "Exif\0\0" prefix (sometimes behind a 4-byte offset field).
+        idx = exif_bytes.find(b"Exif\x00\x00")
+        tiff = exif_bytes[idx + 6 :] if idx != -1 else exif_bytes
+
+        if tiff[:2] == b"MM":
+            endian = ">"
+        elif tiff[:2] == b"II":
+            endian = "<"
+        else:
+            return None
+
+        (ifd0_offset,) = struct.unpack_from(f"{endian}I", tiff, 4)
+
+        exif_ptr = _find_ifd_entry(tiff, endian, ifd0_offset, 0x8769)
+        if exif_ptr is None:
+            return None
+        maker_entry = _find_ifd_entry(tiff, endian, exif_ptr[2], 0x927C)
+        if maker_entry is None:
+            return None
+
+        _, maker_len, maker_offset = maker_entry
+        maker = tiff[maker_offset : maker_offset + maker_len]
+        if not maker.startswith(b"Apple iOS\x00"):
+            return None
+
+        # Apple maker IFD: 14-byte header ("Apple iOS\0" + version + "MM"),
+        # big-endian entries, value offsets relative to the MakerNote start.
+        values = {}
+        for tag in (_APPLE_TAG_HDR_HEADROOM, _APPLE_TAG_HDR_GAIN):
+            entry = _find_ifd_entry(maker, ">", 14, tag)
+            if entry is None:
+                return None
+            typ, _, val_offset = entry
+            fmt = ">iI" if typ == 10 else ">II"  # SRATIONAL vs RATIONAL
+            num, den = struct.unpack_from(fmt, maker, val_offset)
+            if den == 0:
+                return None
+            values[tag] = num / den
+
+        return values[_APPLE_TAG_HDR_HEADROOM], values[_APPLE_TAG_HDR_GAIN]
+    except (struct.error, IndexError, ValueError):
+        return None
+
+
+def _headroom_from_exif(exif_bytes: Optional[bytes]) -> Optional[float]:
+    """Compute headroom from the in-container EXIF MakerNote, if possible."""
+    maker_values = _parse_apple_makernote(exif_bytes)
+    if maker_values is None:
+        return None
+    return compute_headroom(*maker_values)
+
+
+def compute_headroom(
+    maker33: float | np.ndarray, maker48: float | np.ndarray
+) -> float | np.ndarray:
+    """Convert Apple MakerNotes values to HDR headroom.
+
+    Implements Apple's documented piecewise-linear mapping from the
+    HDRHeadroom (0x33) / HDRGain (0x48) MakerNotes pair to stops, then
+    converts to a linear headroom multiplier.
+
+    Accepts scalars or arrays; arrays are evaluated branchlessly by
+    selecting the affine coefficients per element, so a photo-library scan
+    can compute headroom for thousands of images in one vectorized pass
+    instead of one interpreter trip each.
+
+    Args:
+        maker33: MakerNotes:HDRHeadroom value(s).
+        maker48: MakerNotes:HDRGain value(s).
+
+    Returns:
+        Headroom value(s); a float for scalar inputs, ndarray otherwise.
+    """
+    m33 = np.asarray(maker33, dtype=np.float64)
+    m48 = np.asarray(maker48, dtype=np.float64)
+
+    # All four branches are affine in maker48; pick (slope, intercept)
+    # per element and evaluate the mapping once, instead of np.select
+    # over four fully precomputed expressions.
+    low33 = m33 < 1.0
+    low48 = m48 <= 0.01
+    slope = np.where(
+        low33, np.where(low48, -20.0, -0.101), np.where(low48, -70.0, -0.303)
+    )
+    intercept = np.where(
+        low33, np.where(low48, 1.8, 1.601), np.where(low48, 3.0, 2.303)
+    )
+    headroom = np.exp2(np.maximum(slope * m48 + intercept, 0.0))
+
+    if headroom.ndim == 0:
+        return float(headroom)
+    return headroom
+
+
+def _headroom_from_tags(metadata: dict, use_makernote: bool = False) -> float:
+    """Compute headroom from an ExifTool tag dict for one file.
+
+    Prefers the XMP headroom tag when present; otherwise derives headroom
+    from the Apple MakerNotes pair using Apple's documented piecewise formula.
+    """
+    if "XMP:HDRGainMapHeadroom" in metadata and not use_makernote:
+        return float(metadata["XMP:HDRGainMapHeadroom"])
+
+    maker33 = metadata.get("MakerNotes:HDRHeadroom")
+    maker48 = metadata.get("MakerNotes:HDRGain")
+
+    # Plain None check instead of letting the comparison below blow up with
+    # a TypeError: cheap, explicit, and gives a usable error message.
+    if maker33 is None or maker48 is None:
+        source = metadata.get("SourceFile", "<unknown>")
+        raise ValueError(f"No HDR headroom metadata found in {source}")
+
+    return compute_headroom(maker33, maker48)
+
+
+def get_headroom_batch(
+    file_paths: list[str | Path], use_makernote: bool = False
+) -> list[float]:
+    """Extract HDR headroom for many HEIC files in one ExifTool round trip.
+
+    ExifTool accepts multiple files per invocation, amortizing its startup
+    and per-call overhead across the whole batch. Prefer this over calling
+    `get_headroom` in a loop for directory-scale conversions.
+
+    Args:
+        file_paths: Paths to the HEIC files.
         use_makernote: If True, prefer MakerNotes over XMP metadata.
 
     Returns:
-        HDR headroom value (peak luminance ratio).
+        List of HDR headroom values, one per input path, in order.
 
     Raises:
         RuntimeError: If exiftool is not installed.
     """
     _check_exiftool_installed()
 
-    target_tags = [
-        "XMP:HDRGainMapHeadroom",
-        "MakerNotes:HDRHeadroom",
-        "MakerNotes:HDRGain",
-    ]
+    if not file_paths:
+        return []
 
     try:
-        with ExifToolHelper() as et:
-            metadata = et.get_tags(file_path, tags=target_tags)[0]
+        metadata_list = _get_exiftool().get_tags(file_paths, tags=list(_HEADROOM_TAGS))
     except FileNotFoundError as e:
         raise RuntimeError(
             "exiftool executable not found. Please ensure exiftool is installed "
             "and accessible in your PATH."
         ) from e
 
-    if "XMP:HDRGainMapHeadroom" in metadata and not use_makernote:
-        return float(metadata["XMP:HDRGainMapHeadroom"])
+    return [_headroom_from_tags(m, use_makernote) for m in metadata_list]
 
-    maker33 = metadata.get("MakerNotes:HDRHeadroom")
-    maker48 = metadata.get("MakerNotes:HDRGain")
 
-    if maker33 < 1.0:
-        if maker48 <= 0.01:
-            stops = -20.0 * maker48 + 1.8
-        else:
-            stops = -0.101 * maker48 + 1.601
-    else:
-        if maker48 <= 0.01:
-            stops = -70.0 * maker48 + 3.0
-        else:
-            stops = -0.303 * maker48 + 2.303
+def get_headroom(file_path: str | Path, use_makernote: bool = False) -> float:
+    """Extract HDR headroom from Apple HEIC metadata.
 
-    headroom = 2.0 ** max(stops, 0.0)
-    return headroom
+    Args:
+        file_path: Path to the HEIC file.
+        use_makernote: If True, prefer MakerNotes over XMP metadata.
+
+    Returns:
+        HDR headroom value (peak luminance ratio).
+
+    Raises:
+        RuntimeError: If exiftool is not installed.
+
+    Note:
+        Results are memoized per (path, mtime), so repeated queries on the
+        same unchanged file (identify, convert, report phases) hit the
+        cache instead of ExifTool.
+    """
+    return _get_headroom_cached(
+        str(file_path), os.stat(file_path).st_mtime_ns, use_makernote
+    )
+
+
+@functools.lru_cache(maxsize=4096)
+def _get_headroom_cached(file_path: str, mtime_ns: int, use_makernote: bool) -> float:
+    """ExifTool-backed headroom lookup, cached by path and mtime.
+
+    The mtime_ns key exists purely for cache invalidation: rewriting the
+    file changes its mtime and naturally misses the cache.
+    """
+    _check_exiftool_installed()
+
+    try:
+        exiftool = _get_exiftool()
+
+        # Phase 1: the XMP tag alone answers the common modern-iPhone case,
+        # and ExifTool does proportionally less work for a single tag.
+        if not use_makernote:
+            metadata = exiftool.get_tags(file_path, tags=[_HEADROOM_TAGS[0]])[0]
+            if "XMP:HDRGainMapHeadroom" in metadata:
+                return float(metadata["XMP:HDRGainMapHeadroom"])
+
+        # Phase 2: fall back to the full tag set (MakerNotes pair).
+        metadata = exiftool.get_tags(file_path, tags=list(_HEADROOM_TAGS))[0]
+    except FileNotFoundError as e:
+        raise RuntimeError(
+            "exiftool executable not found. Please ensure exiftool is installed "
+            "and accessible in your PATH."
+        ) from e
+
+    return _headroom_from_tags(metadata, use_makernote)
 
 
 def read_apple_heic(filepath: str) -> AppleHeicData:
@@ -213,8 +623,23 @@ def read_apple_heic(filepath: str) -> AppleHeicData:
         - `has_gain_map`: Check if HEIC file contains gain map.
     """
 
-    base, gainmap = read_base_and_gain_map(filepath)
-    headroom = get_headroom(filepath)
+    # Open the container once: pixel data and XMP come from the same parse.
+    try:
+        heif_file = _read_heif(filepath)
+    except Exception as e:
+        print(f"Error: Unable to read HEIC file '{filepath}': {e}")
+        raise
+
+    base, gainmap = _base_and_gain_map_from_heif(heif_file)
+
+    # Prefer in-container metadata (XMP headroom, then the Apple MakerNote
+    # in the EXIF blob); fall back to the ExifTool subprocess only when
+    # neither in-process path yields a value.
+    headroom = _headroom_from_xmp(heif_file.info.get("xmp"))
+    if headroom is None:
+        headroom = _headroom_from_exif(heif_file.info.get("exif"))
+    if headroom is None:
+        headroom = get_headroom(filepath)
 
     if base is None or gainmap is None or headroom is None:
         raise ValueError(f"Failed to read Apple HEIC data from {filepath}")
@@ -24,7 +24,6 @@ from __future__ import annotations
 import os
 import re
 import shutil
-import struct
 import subprocess
 import tempfile
 from typing import Optional, Tuple
@@ -151,11 +150,15 @@ def _process_tile_group(
     return np.array(final_image)
 
 
-def _parse_u16_be(data: bytes) -> list[int]:
-    """Parse bytes as big-endian uint16 array."""
+def _parse_u16_be(data: bytes) -> np.ndarray:
+    """Parse bytes as big-endian uint16 array.
+
+    One np.frombuffer view over the whole blob instead of a struct.unpack
+    call (and a 2-byte slice allocation) per value.
+    """
     if len(data) % 2 != 0:
         raise ValueError(f"tmap data length is not multiple of 2: {len(data)}")
-    return [struct.unpack(">H", data[i : i + 2])[0] for i in range(0, len(data), 2)]
+    return np.frombuffer(data, dtype=">u2")
 
 
 def _gainmapmax_from_u16_triplet(a: int, b: int, c: int) -> float:
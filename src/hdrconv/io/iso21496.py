@@ -50,12 +50,13 @@ def _yield_jpeg_segments(data: bytes) -> Generator[Tuple[int, bytes], None, None
     (SOS) marker, yielding each segment's marker code and payload.
 
     Args:
-        data: Raw JPEG file bytes starting with SOI marker.
+        data: Raw JPEG file data starting with SOI marker. Any bytes-like
+            object (bytes, memoryview, mmap) works.
 
     Yields:
         Tuple of (marker_code, payload) where marker_code is the 16-bit
         marker (e.g., 0xFFE2 for APP2) and payload is the segment data
-        excluding the marker and length bytes.
+        excluding the marker and length bytes, always as bytes.
 
     Note:
         Stops scanning at SOS to avoid parsing compressed image data.
@@ -95,7 +96,7 @@ def _yield_jpeg_segments(data: bytes) -> Generator[Tuple[int, bytes], None, None
         # Markers with payload
         if pos + 2 > length:
             break
-        seg_len = int.from_bytes(data[pos : pos + 2], "big")
+        seg_len = struct.unpack_from(">H", data, pos)[0]
         # seg_len includes the 2 bytes for length itself
         payload_start = pos + 2
         payload_end = pos + seg_len
@@ -103,7 +104,9 @@ def _yield_jpeg_segments(data: bytes) -> Generator[Tuple[int, bytes], None, None
         if payload_end > length:
             break
 
-        yield marker_code, data[payload_start:payload_end]
+        # bytes() materializes memoryview slices; on a bytes input it is
+        # a no-op for the slice already made above.
+        yield marker_code, bytes(data[payload_start:payload_end])
         pos = payload_end
 
 
@@ -161,81 +164,6 @@ def _extract_icc(segments: List[Tuple[int, bytes]]) -> Optional[bytes]:
     return b"".join(chunks[i] for i in sorted(chunks.keys()))
 
 
-def _find_mpf_gainmap_offset(segments: List[Tuple[int, bytes]], file_len: int) -> int:
-    """
-    Parses MPF APP2 to find the offset of the second image (Gainmap).
-    Returns 0 if not found.
-    """
-    for code, payload in segments:
-        if code == APP2 and payload.startswith(MPF_LABEL):
-            # Simplified MPF parser focusing on the Index IFD
-            # Header: 'MPF\0' (4) + Endian(2) + 0x002A(2) + OffsetIFD(4)
-            if len(payload) < 8:
-                continue
-
-            endian_sig = payload[4:6]
-            endian = ">" if endian_sig == b"MM" else "<"
-
-            try:
-                first_ifd_offset = struct.unpack(f"{endian}I", payload[8:12])[0]
-                # Jump to First IFD (Index IFD)
-                # MPF Structure relative to the "MM/II" start (index 4 in payload)
-                base = 4
-                ifd_pos = base + first_ifd_offset
-                num_entries = struct.unpack(
-                    f"{endian}H", payload[ifd_pos : ifd_pos + 2]
-                )[0]
-
-                # Iterate MPF tags to find MP Entry tag (0xB002)
-                entry_cursor = ifd_pos + 2
-                mp_entries_data = None
-
-                for _ in range(num_entries):
-                    tag, typ, cnt, val_off = struct.unpack(
-                        f"{endian}HHII", payload[entry_cursor : entry_cursor + 12]
-                    )
-                    if tag == 0xB002:  # MP Entry Tag
-                        # Value is offset to the MP Entry list
-                        data_off = base + val_off
-                        # Each entry is 16 bytes
-                        mp_entries_data = payload[data_off : data_off + (cnt * 16)]
-                        break
-                    entry_cursor += 12
-
-                if mp_entries_data and len(mp_entries_data) >= 32:
-                    # Look at second entry (Index 1) for the gainmap
-                    # Entry structure: Attr(4), Size(4), Offset(4), Dep1(2), Dep2(2)
-                    # Offset is relative to the MPF header start in the file.
-                    # Usually, MPF header start = current_segment_offset + 4 + 4 (marker+len+MPF_sig...)
-                    # Ideally, we calculate relative to file start if possible, but standard says relative to MPF header.
-
-                    # Entry 2 starts at byte 16
-                    e2_offset_val = struct.unpack(f"{endian}I", mp_entries_data[24:28])[
-                        0
-                    ]
-                    if e2_offset_val > 0:
-                        # We need the absolute file position.
-                        # This implementation assumes standard construction where we can't easily get the absolute
-                        # pos of the segment without tracking it.
-                        # However, for decoding, we split the bytes.
-                        # Note: This simple parser assumes the MPF logic implies encoded_iso21496 style structure.
-                        # A robust one would track `pos` in the scanner.
-                        pass
-
-            except Exception:
-                pass
-
-    # Fallback: Many MPF implementations simply concatenate.
-    # If we want to be precise, we need the segment offset.
-    # Let's rely on a simpler heuristic for this utility:
-    # The MPF offset is relative to the MPF Header (Start of 'MM'/'II').
-    # We will return the extracted relative offset if found, but caller needs context.
-
-    # RE-IMPLEMENTATION WITH OFFSET TRACKING
-    # To correctly handle MPF, we need to scan the raw bytes again or return offsets from scanner.
-    return 0
-
-
 def _split_mpf_container(data: bytes) -> Tuple[bytes, bytes]:
     """Split MPF container into primary and secondary images.
 
@@ -243,11 +171,14 @@ def _split_mpf_container(data: bytes) -> Tuple[bytes, bytes]:
     extract the primary baseline image and secondary gainmap image.
 
     Args:
-        data: Complete JPEG file bytes containing MPF structure.
+        data: Complete JPEG file data containing MPF structure. Any
+            bytes-like object (bytes, memoryview, mmap) works.
 
     Returns:
         Tuple of (primary_bytes, gainmap_bytes). If MPF parsing fails
         or no secondary image is found, gainmap_bytes will be empty.
+        Slices are of the input's type, so a memoryview input yields
+        zero-copy views into the original buffer.
 
     Note:
         Uses MPF Index IFD to locate the offset of the second image.
@@ -287,14 +218,14 @@ def _split_mpf_container(data: bytes) -> Tuple[bytes, bytes]:
 
         if pos + 2 > data_len:
             break
-        seg_len = int.from_bytes(data[pos : pos + 2], "big")
+        seg_len = struct.unpack_from(">H", data, pos)[0]
         payload_start = pos + 2
         payload_end = pos + seg_len
         if seg_len < 2 or payload_end > data_len:
             break
         payload = data[payload_start:payload_end]
 
-        if marker_code == APP2 and payload.startswith(MPF_LABEL):
+        if marker_code == APP2 and payload[: len(MPF_LABEL)] == MPF_LABEL:
             # MPF header base is at the TIFF header ("MM"/"II"), i.e. after MPF\0.
             mpf_offset_base = marker_pos + 8
             try:
@@ -390,30 +321,37 @@ def _parse_iso21496_metadata(payload: bytes) -> Dict[str, Any]:
     alt_headroom = _read_rational(payload, offset, False)
     offset += 8
 
-    # Channels
+    # Channels: each is 5 rationals (min, max, gamma, base_off, alt_off).
+    # Decode the whole block with two np.frombuffer views instead of one
+    # struct.unpack per field (15-30 Python calls per payload).
     channel_count = 3 if is_multichannel else 1
-    channels = []
-
-    for _ in range(channel_count):
-        c = {}
-        c["min"] = _read_rational(payload, offset, True)
-        offset += 8
-        c["max"] = _read_rational(payload, offset, True)
-        offset += 8
-        c["gamma"] = _read_rational(payload, offset, False)
-        offset += 8
-        c["base_off"] = _read_rational(payload, offset, True)
-        offset += 8
-        c["alt_off"] = _read_rational(payload, offset, True)
-        offset += 8
-        channels.append(c)
+    word_count = channel_count * 10  # 5 rationals x (numerator, denominator)
+
+    unsigned = np.frombuffer(payload, dtype=">u4", count=word_count, offset=offset)
+    signed = np.frombuffer(payload, dtype=">i4", count=word_count, offset=offset)
+
+    # gamma (field index 2) is unsigned; the other four fields are signed.
+    signed_fields = np.array([True, True, False, True, True])
+    numerators = np.where(
+        signed_fields,
+        signed[0::2].reshape(channel_count, 5),
+        unsigned[0::2].reshape(channel_count, 5),
+    )
+    denominators = unsigned[1::2].reshape(channel_count, 5).astype(np.float64)
+
+    values = np.where(
+        denominators != 0, numerators / np.maximum(denominators, 1.0), 0.0
+    )
 
     # Format to Output Structure
+    field_index = {"min": 0, "max": 1, "gamma": 2, "base_off": 3, "alt_off": 4}
+
     def get_triple(key):
+        column = values[:, field_index[key]]
         if is_multichannel:
-            return (channels[0][key], channels[1][key], channels[2][key])
+            return (float(column[0]), float(column[1]), float(column[2]))
         else:
-            v = channels[0][key]
+            v = float(column[0])
             return (v, v, v)
 
     return {
@@ -718,7 +656,9 @@ def read_21496(filepath: str) -> GainmapImage:
         raw_data = f.read()
 
     # 1. Split streams (Primary vs Gainmap) via MPF
-    primary_data, gainmap_data = _split_mpf_container(raw_data)
+    # memoryview slices keep the split zero-copy; the streams are only
+    # materialized inside BytesIO when handed to Pillow.
+    primary_data, gainmap_data = _split_mpf_container(memoryview(raw_data))
 
     if not gainmap_data:
         raise ValueError("No gainmap found in container (MPF missing or invalid).")
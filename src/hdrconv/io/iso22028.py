@@ -11,13 +11,32 @@ Public APIs:
     - `write_22028_pq`: Write HDRImage to PQ AVIF
 """
 
+import mmap
+from typing import Optional
+
 from hdrconv.core import HDRImage
 
 from imagecodecs import avif_encode, avif_decode
 import numpy as np
 
+# CICP codes (ITU-T H.273) for the color metadata embedded in AVIF,
+# built once at import rather than per write call.
+_PRIMARIES_CODES = {"bt709": 1, "bt2020": 9, "p3": 12}
+_TRANSFER_CODES = {"bt709": 1, "linear": 8, "pq": 16, "hlg": 18}
+
+
+def _tile_log2(extent: int) -> int:
+    """log2 tile count along one axis, targeting ~512 px AV1 tiles.
+
+    Without tiles a multithreaded AV1 decoder runs effectively
+    single-threaded; clamped to the spec maximum of 6.
+    """
+    return min(6, max(0, (extent // 512).bit_length() - 1))
 
-def read_22028_pq(filepath: str) -> HDRImage:
+
+def read_22028_pq(
+    filepath: str, out: Optional[np.ndarray] = None, bit_depth: int = 10
+) -> HDRImage:
     """Read ISO 22028-5 PQ AVIF file.
 
     Decodes an AVIF file encoded with Perceptual Quantizer (PQ) transfer
@@ -25,29 +44,52 @@ def read_22028_pq(filepath: str) -> HDRImage:
 
     Args:
         filepath: Path to the PQ AVIF file.
+        out: Optional preallocated float32 destination of matching shape;
+            batch workers can reuse one buffer across same-sized files
+            instead of paying an allocation per frame.
+        bit_depth: Bit depth the file was encoded at; sets the decode
+            range. Default: 10 (codes 0-1023).
 
     Returns:
         HDRImage dict containing:
         - ``data`` (np.ndarray): PQ-encoded array, float32, shape (H, W, 3),
-            range [0, 1] representing 0-10000 nits.
+            range [0, 1] representing 0-10000 nits. The ``out`` array when
+            provided, a fresh array otherwise.
         - ``color_space`` (str): Color primaries, typically 'bt2020'.
         - ``transfer_function`` (str): Always 'pq'.
         - ``icc_profile`` (bytes | None): Currently None (not extracted).
 
     Note:
-        Currently assumes BT.2020 color primaries and 10-bit decode range.
+        Currently assumes BT.2020 color primaries; the bit depth is not
+        read back from the file and must match what was encoded.
         Future versions may extract actual color metadata from AVIF.
 
     See Also:
         - `write_22028_pq`: Write HDR image to PQ AVIF format.
         - `inverse_pq`: Convert PQ-encoded data to linear light.
     """
+    # Memory-map the compressed payload instead of reading it onto the
+    # heap: avif_decode takes any buffer, so the kernel pages the file
+    # in on demand and no bytes copy coexists with the decoded pixels.
     with open(filepath, "rb") as f:
-        avif_bytes = f.read()
-    image_array = avif_decode(avif_bytes, numthreads=-1)
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as avif_bytes:
+            image_array = avif_decode(avif_bytes, numthreads=-1)
     # Extract PQ-encoded array (normalized to [0, 1])
-    # Currently hard-coded to 10-bit decode range.
-    image_array = image_array / 1023.0
+    # float32 is ample for 10/12-bit data; dividing the integer array
+    # directly would promote to float64 and double the memory traffic.
+    scale = np.float32((1 << bit_depth) - 1)
+    if out is not None:
+        if out.shape != image_array.shape or out.dtype != np.float32:
+            raise ValueError(
+                f"out buffer must be float32 with shape {image_array.shape}; "
+                f"got {out.dtype} with shape {out.shape}."
+            )
+        np.divide(image_array, scale, out=out)
+        image_array = out
+    else:
+        # dtype=float32 fuses the cast and the divide into one pass
+        # instead of materializing a float copy first.
+        image_array = np.divide(image_array, scale, dtype=np.float32)
     # BT.2020 PQ is the most common format for HDR AVIF files
     return HDRImage(
         data=image_array,
@@ -57,7 +99,14 @@ def read_22028_pq(filepath: str) -> HDRImage:
     )
 
 
-def write_22028_pq(data: HDRImage, filepath: str) -> None:
+def write_22028_pq(
+    data: HDRImage,
+    filepath: str,
+    bit_depth: int = 10,
+    speed: int = 8,
+    codec: Optional[str] = None,
+    validate: bool = True,
+) -> None:
     """Write ISO 22028-5 PQ AVIF file.
 
     Encodes an HDR image to AVIF format with Perceptual Quantizer (PQ)
@@ -69,34 +118,62 @@ def write_22028_pq(data: HDRImage, filepath: str) -> None:
             - ``color_space``: Color primaries ('bt709', 'p3', 'bt2020').
             - ``transfer_function``: Transfer function ('pq', 'hlg', etc.).
         filepath: Output path for the AVIF file.
+        bit_depth: Encoded bit depth; sets both the quantization scale
+            and the AVIF sample depth. Default: 10.
+        speed: AV1 encoder speed preset (0 slowest to 10 fastest).
+            Default: 8.
+        codec: AV1 encoder backend ('aom', 'rav1e', 'svt', ...), if the
+            installed imagecodecs build includes it. None lets libavif
+            choose. Default: None.
+        validate: Clip the input into [0, 1] before quantizing. Batch
+            pipelines whose data is already in range can pass False to
+            skip that full-frame pass; out-of-range values then wrap in
+            the uint16 cast. Default: True.
 
     Note:
-        Output is encoded at 10-bit depth with quality level 90.
+        Output is encoded at quality level 90.
         Color primaries and transfer characteristics are embedded in AVIF metadata.
 
     See Also:
         - `read_22028_pq`: Read PQ AVIF file.
         - `apply_pq`: Convert linear HDR to PQ-encoded values.
     """
-    # Map color primaries to numeric codes
-    primaries_map = {"bt709": 1, "bt2020": 9, "p3": 12}
-
-    # Map transfer characteristics to numeric codes
-    transfer_map = {"bt709": 1, "linear": 8, "pq": 16, "hlg": 18}
-
-    primaries_code = primaries_map.get(data["color_space"], 9)
-    transfer_code = transfer_map.get(data["transfer_function"], 16)
-
-    np_array = np.clip(data["data"], 0, 1)
-    # scale to [0, 1023]
-    np_array = np_array * 1023.0
-    np_array = np_array.astype(np.uint16)
+    primaries_code = _PRIMARIES_CODES.get(data["color_space"], 9)
+    transfer_code = _TRANSFER_CODES.get(data["transfer_function"], 16)
+
+    # Clip into a working copy (the caller's array is left untouched),
+    # scale it in place, then round straight into the uint16 buffer:
+    # rint leaves integral values, so the unsafe cast is exact and the
+    # quantizer rounds to nearest instead of truncating (a 0.5 LSB
+    # bias) without a scaled float intermediate. With validation off
+    # the multiply allocates the working copy instead of the clip.
+    scale = float((1 << bit_depth) - 1)
+    if validate:
+        np_array = np.clip(data["data"], 0.0, 1.0)
+        np_array *= scale
+    else:
+        np_array = data["data"] * np.float32(scale)
+    quantized = np.empty(np_array.shape, dtype=np.uint16)
+    np.rint(np_array, out=quantized, casting="unsafe")
+    np_array = quantized
+
+    # The staging buffer above is freshly allocated and C-contiguous;
+    # this guard is free when that holds and keeps a future refactor
+    # from handing avif_encode a strided view (hidden memcpy inside
+    # the encoder).
+    if not np_array.flags["C_CONTIGUOUS"]:
+        np_array = np.ascontiguousarray(np_array)
 
     avif_bytes: bytes = avif_encode(
         np_array,
         level=90,
-        speed=8,
-        bitspersample=10,
+        speed=speed,
+        codec=codec,
+        bitspersample=bit_depth,
+        # Tile large images so multithreaded AV1 decoders (including
+        # read_22028_pq) can actually parallelize; small images get
+        # (0, 0), a single tile, as before.
+        tilelog2=(_tile_log2(np_array.shape[0]), _tile_log2(np_array.shape[1])),
         primaries=primaries_code,
         transfer=transfer_code,
         numthreads=-1,
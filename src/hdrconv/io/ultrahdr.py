@@ -17,8 +17,11 @@ Note:
 from __future__ import annotations
 
 import io
+import mmap
+import re
 import warnings
 import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Dict, List, Optional, Tuple
 
 import numpy as np
@@ -41,50 +44,64 @@ XMP_HEADER = b"http://ns.adobe.com/xap/1.0/\x00"
 HDRGM_NS = "http://ns.adobe.com/hdr-gain-map/1.0/"
 RDF_NS = "http://www.w3.org/1999/02/22-rdf-syntax-ns#"
 
+# Clark-notation prefix ElementTree puts on hdrgm attributes and tags,
+# built once so the parse loops do a single startswith + slice per key
+# instead of reconstructing the "{ns}" string for every attribute.
+_HDRGM_PREFIX = "{" + HDRGM_NS + "}"
+_HDRGM_PREFIX_LEN = len(_HDRGM_PREFIX)
+_RDF_DESCRIPTION_TAG = "{" + RDF_NS + "}Description"
+_NAMESPACES = {"rdf": RDF_NS, "hdrgm": HDRGM_NS}
+_BOOL_MAP = {"true": True, "false": False}
+# Decimal or scientific notation; anything float() would reject falls
+# through to the string case without raising.
+_FLOAT_RE = re.compile(r"[+-]?(?:\d+\.\d*|\.\d+|\d+[eE][+-]?\d+)(?:[eE][+-]?\d+)?\Z")
+
 
 # -----------------------------------------------------------------------------
 # XMP Parsing / Encoding
 # -----------------------------------------------------------------------------
 
 
-def _extract_xmp_payload(app1_payload: bytes) -> Optional[str]:
+def _extract_xmp_payload(app1_payload: bytes) -> Optional[bytes]:
+    # Returned as bytes: ET.fromstring handles encoding itself, so decoding
+    # the whole payload to str here would be a wasted full-buffer pass.
     if app1_payload.startswith(XMP_HEADER):
-        xml_bytes = app1_payload[len(XMP_HEADER) :]
-    else:
-        # Try to locate XML start
-        start = app1_payload.find(b"<")
-        if start == -1:
-            return None
-        xml_bytes = app1_payload[start:]
+        return app1_payload[len(XMP_HEADER) :]
 
-    try:
-        return xml_bytes.decode("utf-8", errors="ignore")
-    except UnicodeDecodeError:
+    # Try to locate XML start
+    start = app1_payload.find(b"<")
+    if start == -1:
         return None
+    return app1_payload[start:]
 
 
 def _parse_hdrgm_value(value: str) -> Any:
     text = value.strip()
-    if text.lower() == "true":
-        return True
-    if text.lower() == "false":
-        return False
-    try:
-        if "." in text or "e" in text.lower():
-            return float(text)
+    boolean = _BOOL_MAP.get(text.lower())
+    if boolean is not None:
+        return boolean
+    # Shape-check before converting: raising and catching ValueError per
+    # non-numeric attribute is far costlier than these tests.
+    body = text[1:] if text[:1] in "+-" else text
+    if body.isdecimal():
         return int(text)
-    except ValueError:
-        return text
+    if _FLOAT_RE.match(text):
+        return float(text)
+    return text
 
 
-def _parse_hdrgm_metadata(xmp_xml: str) -> Dict[str, Any]:
+def _parse_hdrgm_metadata(xmp_xml: bytes) -> Dict[str, Any]:
+    # Stream-parse and stop at the first rdf:Description: its attributes
+    # and rdf:Seq children are all we read, so the rest of the packet
+    # (camera XMP can carry many unrelated blocks) is never built.
+    description = None
     try:
-        root = ET.fromstring(xmp_xml)
+        for _event, elem in ET.iterparse(io.BytesIO(xmp_xml), events=("end",)):
+            if elem.tag == _RDF_DESCRIPTION_TAG:
+                description = elem
+                break
     except ET.ParseError:
         return {}
-
-    namespaces = {"rdf": RDF_NS, "hdrgm": HDRGM_NS}
-    description = root.find("rdf:RDF/rdf:Description", namespaces)
     if description is None:
         return {}
 
@@ -92,20 +109,19 @@ def _parse_hdrgm_metadata(xmp_xml: str) -> Dict[str, Any]:
 
     # Attributes
     for key, value in description.attrib.items():
-        if key.startswith("{" + HDRGM_NS + "}"):
-            clean_key = key.replace("{" + HDRGM_NS + "}", "")
-            metadata[clean_key] = _parse_hdrgm_value(value)
+        if key.startswith(_HDRGM_PREFIX):
+            metadata[key[_HDRGM_PREFIX_LEN:]] = _parse_hdrgm_value(value)
 
     # Child elements with rdf:Seq
     for child in list(description):
-        if not child.tag.startswith("{" + HDRGM_NS + "}"):
+        if not child.tag.startswith(_HDRGM_PREFIX):
             continue
-        clean_key = child.tag.replace("{" + HDRGM_NS + "}", "")
-        seq = child.find("rdf:Seq", namespaces)
+        clean_key = child.tag[_HDRGM_PREFIX_LEN:]
+        seq = child.find("rdf:Seq", _NAMESPACES)
         if seq is None:
             continue
         values: List[float] = []
-        for li in seq.findall("rdf:li", namespaces):
+        for li in seq.findall("rdf:li", _NAMESPACES):
             if li.text:
                 try:
                     values.append(float(li.text.strip()))
@@ -303,37 +319,58 @@ def read_ultrahdr(filepath: str) -> GainmapImage:
     Raises:
         ValueError: If gainmap stream or HDR gainmap metadata is missing.
     """
+    # mmap instead of read(): no full-file bytes copy, and the OS pages in
+    # only the regions the marker scan and decoders actually touch.
     with open(filepath, "rb") as f:
-        raw_data = f.read()
+        raw_data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
 
-    primary_data, gainmap_data = _split_mpf_container(raw_data)
+    # Work on a memoryview: the primary/gainmap streams are big (whole
+    # embedded JPEGs), and view slices avoid copying each of them here.
+    # BytesIO below accepts the views directly.
+    data = memoryview(raw_data)
+    primary_data, gainmap_data = _split_mpf_container(data)
 
     # Fallback: split by EOI+SOI if MPF is missing
     if not gainmap_data:
         separator = b"\xff\xd9\xff\xd8"
         split_pos = raw_data.find(separator)
         if split_pos != -1:
-            primary_data = raw_data[: split_pos + 2]
-            gainmap_data = raw_data[split_pos + 2 :]
+            primary_data = data[: split_pos + 2]
+            gainmap_data = data[split_pos + 2 :]
 
     if not gainmap_data:
+        del primary_data, gainmap_data
+        data.release()
+        raw_data.close()
         raise ValueError("No gainmap found in container (MPF missing or invalid).")
 
+    def _decode_jpeg(stream) -> np.ndarray:
+        return np.array(Image.open(io.BytesIO(stream)).convert("RGB"))
+
     with warnings.catch_warnings():
         warnings.filterwarnings(
             "ignore",
             message="Image appears to be a malformed MPO file",
             category=UserWarning,
         )
-        base_img = Image.open(io.BytesIO(primary_data)).convert("RGB")
-        gain_img = Image.open(io.BytesIO(gainmap_data)).convert("RGB")
-
-    base_arr = np.array(base_img)
-    gain_arr = np.array(gain_img)
+        # libjpeg releases the GIL during decode, so the primary and
+        # gainmap streams decode concurrently.
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            base_future = executor.submit(_decode_jpeg, primary_data)
+            gain_future = executor.submit(_decode_jpeg, gainmap_data)
+            base_arr = base_future.result()
+            gain_arr = gain_future.result()
 
     base_segments = list(_yield_jpeg_segments(primary_data))
     gain_segments = list(_yield_jpeg_segments(gainmap_data))
 
+    # Everything from here on uses decoded arrays and copied segment
+    # payloads; drop the views so the map can close (it refuses while
+    # exports are alive).
+    del primary_data, gainmap_data
+    data.release()
+    raw_data.close()
+
     base_icc = _extract_icc(base_segments)
     gain_icc = _extract_icc(gain_segments)
 